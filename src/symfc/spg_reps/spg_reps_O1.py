@@ -68,11 +68,13 @@ class SpgRepsO1(SpgRepsBase):
         coordinates.
 
         """
+        rotations = np.array(self._unique_rotations, dtype="double")
+        r1_reps_dense = self._lattice.T @ rotations @ self._lattice_T_inv
         r1_reps = []
-        for r in self._unique_rotations:
-            r1_rep: np.ndarray = self._lattice.T @ r @ np.linalg.inv(self._lattice.T)
-            row, col = np.nonzero(np.abs(r1_rep) > tol)
-            data = r1_rep[(row, col)]
+        for r1_rep in r1_reps_dense:
+            idx = np.flatnonzero(np.abs(r1_rep) > tol)
+            row, col = np.divmod(idx, r1_rep.shape[1])
+            data = r1_rep.ravel()[idx]
             r1_reps.append(csr_array((data, (row, col)), shape=r1_rep.shape))
         self._r1_reps = r1_reps
 
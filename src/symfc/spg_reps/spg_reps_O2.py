@@ -12,6 +12,24 @@ from symfc.utils.utils import SymfcAtoms
 from .spg_reps_base import SpgRepsBase
 
 
+def _get_r2_rep(r_c: np.ndarray, tol: float = 1e-10) -> csr_array:
+    """Return sparse kron(r_c, r_c) without allocating the dense 9x9 matrix.
+
+    Nonzero elements of kron(r_c, r_c) are products of pairs of nonzero
+    elements of r_c, whose indices are (i * 3 + k, j * 3 + l) for r_c[i, j] and
+    r_c[k, l].
+
+    """
+    idx = np.flatnonzero(np.abs(r_c) > tol)
+    row_c, col_c = np.divmod(idx, 3)
+    data_c = r_c.ravel()[idx]
+    row = (row_c[:, None] * 3 + row_c[None, :]).ravel()
+    col = (col_c[:, None] * 3 + col_c[None, :]).ravel()
+    data = (data_c[:, None] * data_c[None, :]).ravel()
+    nonzero = np.abs(data) > tol
+    return csr_array((data[nonzero], (row[nonzero], col[nonzero])), shape=(9, 9))
+
+
 class SpgRepsO2(SpgRepsBase):
     """Class of reps of space group operations for fc2."""
 
@@ -62,14 +80,9 @@ class SpgRepsO2(SpgRepsBase):
 
     def _compute_r2_reps(self, tol: float = 1e-10):
         """Compute and return 2nd rank tensor rotation matricies."""
-        r2_reps = []
-        for r in self._unique_rotations:
-            r_c = self._lattice.T @ r @ np.linalg.inv(self._lattice.T)
-            r2_rep = np.kron(r_c, r_c)
-            row, col = np.nonzero(np.abs(r2_rep) > tol)
-            data = r2_rep[(row, col)]
-            r2_reps.append(csr_array((data, (row, col)), shape=r2_rep.shape))
-        self._r2_reps = r2_reps
+        rotations = np.array(self._unique_rotations, dtype="double")
+        r_cs = self._lattice.T @ rotations @ self._lattice_T_inv
+        self._r2_reps = [_get_r2_rep(r_c, tol=tol) for r_c in r_cs]
 
     def _get_sigma2_rep_data(self, i: int, nonzero: np.ndarray = None) -> csr_array:
         """Compute vector representation of i-th atomic pair permutation matrix.
@@ -137,27 +150,20 @@ class SpgRepsO2MatrixReps(SpgRepsBase):
     def _prepare(self, spacegroup_operations):
         super()._prepare(spacegroup_operations)
         N = len(self._numbers)
-        a = np.arange(N)
-        self._atom_pairs = np.stack(np.meshgrid(a, a), axis=-1).reshape(-1, 2)
-        self._coeff = np.array([1, N], dtype=int)
-        self._col = self._atom_pairs @ self._coeff
+        self._col = np.arange(N * N, dtype=int)
+        self._i_atoms, self._j_atoms = np.divmod(self._col, N)
         self._data = np.ones(N * N, dtype=int)
         self._compute_r2_reps()
 
     def _compute_r2_reps(self, tol: float = 1e-10):
         """Compute and return 2nd rank tensor rotation matricies."""
-        r2_reps = []
-        for r in self._unique_rotations:
-            r_c = self._lattice.T @ r @ np.linalg.inv(self._lattice.T)
-            r2_rep = np.kron(r_c, r_c)
-            row, col = np.nonzero(np.abs(r2_rep) > tol)
-            data = r2_rep[(row, col)]
-            r2_reps.append(csr_array((data, (row, col)), shape=r2_rep.shape))
-        self._r2_reps = r2_reps
+        rotations = np.array(self._unique_rotations, dtype="double")
+        r_cs = self._lattice.T @ rotations @ self._lattice_T_inv
+        self._r2_reps = [_get_r2_rep(r_c, tol=tol) for r_c in r_cs]
 
     def _get_sigma2_rep_data(self, i: int) -> csr_array:
         uri = self._unique_rotation_indices
         permutation = self._permutations[uri[i]]
-        NN = len(self._numbers) ** 2
-        row = permutation[self._atom_pairs] @ self._coeff
-        return self._data, row, self._col, (NN, NN)
+        N = len(self._numbers)
+        row = permutation[self._i_atoms] * N + permutation[self._j_atoms]
+        return self._data, row, self._col, (N * N, N * N)
@@ -50,6 +50,32 @@ class SpgRepsO3(SpgRepsBase):
         """
         return self._get_sigma3_rep_data(i, nonzero=nonzero)
 
+    def get_all_sigma3_reps(self, nonzero: np.ndarray = None) -> np.ndarray:
+        """Compute vector representations of all atomic triplet permutations.
+
+        Parameters
+        ----------
+        nonzero : ndarray, optional
+            Mask of atomic triplets to be computed, by default None.
+
+        Returns
+        -------
+        ndarray
+            shape=(len(unique_rotation_indices), n_triplets). Each row is the
+            same as get_sigma3_rep(i, nonzero=nonzero).
+
+        """
+        if nonzero is not None:
+            triplets = self._atom_triplets[nonzero]
+        else:
+            triplets = self._atom_triplets
+        permutations = self._permutations[self._unique_rotation_indices]
+        permutation_triplets = permutations[:, triplets[:, 0]].astype("int_")
+        permutation_triplets *= self._coeff[0]
+        permutation_triplets += permutations[:, triplets[:, 1]] * self._coeff[1]
+        permutation_triplets += permutations[:, triplets[:, 2]]
+        return permutation_triplets
+
     def _prepare(self, spacegroup_operations):
         super()._prepare(spacegroup_operations)
         N = len(self._numbers)
@@ -64,10 +90,11 @@ class SpgRepsO3(SpgRepsBase):
         """Compute and return 3rd rank tensor rotation matricies."""
         r3_reps = []
         for r in self._unique_rotations:
-            r_c = self._lattice.T @ r @ np.linalg.inv(self._lattice.T)
+            r_c = self._lattice.T @ r @ self._lattice_T_inv
             r3_rep = np.kron(r_c, np.kron(r_c, r_c))
-            row, col = np.nonzero(np.abs(r3_rep) > tol)
-            data = r3_rep[(row, col)]
+            idx = np.flatnonzero(np.abs(r3_rep) > tol)
+            row, col = np.divmod(idx, r3_rep.shape[1])
+            data = r3_rep.ravel()[idx]
             r3_reps.append(csr_array((data, (row, col)), shape=r3_rep.shape))
         self._r3_reps = r3_reps
 
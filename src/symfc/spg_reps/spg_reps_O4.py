@@ -64,10 +64,11 @@ class SpgRepsO4(SpgRepsBase):
         """Compute and return 4th rank tensor rotation matricies."""
         r4_reps = []
         for r in self._unique_rotations:
-            r_c = self._lattice.T @ r @ np.linalg.inv(self._lattice.T)
+            r_c = self._lattice.T @ r @ self._lattice_T_inv
             r4_rep = np.kron(r_c, np.kron(r_c, np.kron(r_c, r_c)))
-            row, col = np.nonzero(np.abs(r4_rep) > tol)
-            data = r4_rep[(row, col)]
+            idx = np.flatnonzero(np.abs(r4_rep) > tol)
+            row, col = np.divmod(idx, r4_rep.shape[1])
+            data = r4_rep.ravel()[idx]
             r4_reps.append(csr_array((data, (row, col)), shape=r4_rep.shape))
         self._r4_reps = r4_reps
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Optional
 
 import numpy as np
@@ -34,6 +35,7 @@ class SpgRepsBase:
 
         """
         self._lattice = np.array(supercell.cell, dtype="double", order="C")
+        self._lattice_T_inv = np.linalg.inv(self._lattice.T)
         self._positions = np.array(
             supercell.scaled_positions, dtype="double", order="C"
         )
@@ -79,23 +81,24 @@ class SpgRepsBase:
         self._p2s_map = get_indep_atoms_by_lat_trans(self._translation_permutations)
 
     def _get_translation_permutations(self, rotations) -> np.ndarray:
-        eye3 = np.eye(3, dtype=int)
-        trans_perms = []
-        for r, perm in zip(rotations, self._permutations):
-            if np.array_equal(r, eye3):
-                trans_perms.append(perm)
-        return np.array(trans_perms, dtype="intc", order="C")
-
-    def _get_unique_rotation_indices(self, rotations: np.ndarray) -> list[int]:
+        is_identity = np.all(rotations == np.eye(3, dtype="int8"), axis=(1, 2))
+        return np.ascontiguousarray(self._permutations[is_identity], dtype="intc")
+
+    def _get_unique_rotation_indices(
+        self, rotations: np.ndarray
+    ) -> tuple[list[int], list[np.ndarray]]:
+        """Return indices and matrices of first appearances of rotations.
+
+        Bytes of int8 rotation matrices are used as hash keys.
+
+        """
         unique_rotations: list[np.ndarray] = []
         indices = []
+        seen = set()
         for i, r in enumerate(rotations):
-            is_found = False
-            for ur in unique_rotations:
-                if np.array_equal(r, ur):
-                    is_found = True
-                    break
-            if not is_found:
+            key = r.tobytes()
+            if key not in seen:
+                seen.add(key)
                 unique_rotations.append(r)
                 indices.append(i)
         return indices, unique_rotations
@@ -117,7 +120,7 @@ class SpgRepsBase:
         -------
         rotations : array_like
             A set of rotation matrices of inverse space group operations.
-            (n_symops, 3, 3), dtype='intc', order='C'
+            (n_symops, 3, 3), dtype='int8', order='C'
         translations : array_like
             A set of translation vectors. It is assumed that inverse matrices are
             included in this set.
@@ -125,16 +128,41 @@ class SpgRepsBase:
 
         """
         if spacegroup_operations is None:
-            try:
-                import spglib
-            except ImportError as exc:
-                raise ModuleNotFoundError(
-                    "Spglib python module was not found."
-                ) from exc
-
-            symops = spglib.get_symmetry(
-                (self._lattice, self._positions, self._numbers)
+            rotations, translations = _get_symmetry(
+                self._lattice.tobytes(),
+                self._positions.tobytes(),
+                np.array(self._numbers, dtype="intc").tobytes(),
             )
         else:
-            symops = spacegroup_operations
-        return symops["rotations"], symops["translations"]
+            rotations = spacegroup_operations["rotations"]
+            translations = spacegroup_operations["translations"]
+        return (
+            np.array(rotations, dtype="int8", order="C"),
+            np.array(translations, dtype="double", order="C"),
+        )
+
+
+@functools.lru_cache(maxsize=8)
+def _get_symmetry(
+    lattice: bytes, positions: bytes, numbers: bytes
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return rotations and translations of space group operations by spglib.
+
+    Results are cached because the same supercell is often used to construct
+    SpgReps of different orders. Arrays are passed as bytes to be hashable.
+    Returned arrays must not be modified.
+
+    """
+    try:
+        import spglib
+    except ImportError as exc:
+        raise ModuleNotFoundError("Spglib python module was not found.") from exc
+
+    symops = spglib.get_symmetry(
+        (
+            np.frombuffer(lattice, dtype="double").reshape(3, 3),
+            np.frombuffer(positions, dtype="double").reshape(-1, 3),
+            np.frombuffer(numbers, dtype="intc"),
+        )
+    )
+    return symops["rotations"], symops["translations"]
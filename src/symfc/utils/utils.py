@@ -102,27 +102,20 @@ def compute_sg_permutations(
     """
     trans_perms = []
     pure_trans = []
-    n_atom = positions.shape[0]
     decimals = _find_optimal_decimals(positions)
     sorted_ids, sorted_positions = argsort_positions(positions, decimals=decimals)
     for r, t in zip(rotations, translations):
         if (r != np.eye(3, dtype=int)).any():
             continue
-        trans_positions = positions + t
-        sorted_trans_ids, sorted_trans_positions = argsort_positions(
-            trans_positions,
+        tp = _compute_permutation(
+            positions,
+            positions + t,
+            sorted_ids,
+            sorted_positions,
+            lattice,
             decimals=decimals,
+            symprec=symprec,
         )
-        if np.allclose(sorted_trans_positions - sorted_positions, 0.0):
-            tp = np.zeros(n_atom, dtype=int)
-            tp[sorted_trans_ids] = sorted_ids
-        else:
-            diffs = positions[None, :, :] - trans_positions[:, None, :]
-            diffs -= np.rint(diffs)
-            dists = np.linalg.norm(diffs @ lattice.T, axis=2)
-            rows, cols = np.where(dists < symprec)
-            assert len(positions) == len(np.unique(rows)) == len(np.unique(cols))
-            tp = cols[np.argsort(rows)]
         trans_perms.append(tp)
         pure_trans.append(t)
     trans_perms = np.array(trans_perms, dtype=int)
@@ -147,12 +140,17 @@ def compute_sg_permutations(
 
     unique_rotation_perms = []
     for rotated_positions in unique_rotated_positions:
-        diffs = positions[None, :, :] - rotated_positions[:, None, :]
-        diffs -= np.rint(diffs)
-        dists = np.linalg.norm(diffs @ lattice.T, axis=2)
-        rows, cols = np.where(dists < symprec)
-        assert len(positions) == len(np.unique(rows)) == len(np.unique(cols))
-        unique_rotation_perms.append(cols[np.argsort(rows)])
+        unique_rotation_perms.append(
+            _compute_permutation(
+                positions,
+                rotated_positions,
+                sorted_ids,
+                sorted_positions,
+                lattice,
+                decimals=decimals,
+                symprec=symprec,
+            )
+        )
     unique_rotation_perms = np.array(unique_rotation_perms, dtype=int)
 
     out = []
@@ -169,6 +167,39 @@ def compute_sg_permutations(
     return out
 
 
+def _compute_permutation(
+    positions: np.ndarray,
+    transformed_positions: np.ndarray,
+    sorted_ids: list[int],
+    sorted_positions: np.ndarray,
+    lattice: np.ndarray,
+    decimals: int = 5,
+    symprec: float = 1e-5,
+) -> np.ndarray:
+    """Return permutation of atoms by transformation of positions.
+
+    Atoms are matched by comparing rounded and sorted positions in
+    O(N log N). When the rounded positions do not agree, e.g., an atom lies
+    near the rounding boundary, all pairwise distances are computed in O(N^2).
+
+    """
+    sorted_transformed_ids, sorted_transformed_positions = argsort_positions(
+        transformed_positions,
+        decimals=decimals,
+    )
+    if np.allclose(sorted_transformed_positions - sorted_positions, 0.0):
+        perm = np.zeros(positions.shape[0], dtype=int)
+        perm[sorted_transformed_ids] = sorted_ids
+        return perm
+
+    diffs = positions[None, :, :] - transformed_positions[:, None, :]
+    diffs -= np.rint(diffs)
+    dists = np.linalg.norm(diffs @ lattice.T, axis=2)
+    rows, cols = np.where(dists < symprec)
+    assert len(positions) == len(np.unique(rows)) == len(np.unique(cols))
+    return cols[np.argsort(rows)]
+
+
 def compute_sg_permutations_stable(
     positions: np.ndarray,
     rotations: np.ndarray,
@@ -44,16 +44,13 @@ def get_atomic_lat_trans_decompr_indices_O3(trans_perms: np.ndarray) -> np.ndarr
     n_lp, N = trans_perms.shape
     size_row = N**3
 
-    n = 0
+    n = len(indep_atoms) * N**2
+    values = np.arange(n, dtype="int_")
     indices = np.zeros(size_row, dtype="int_")
-    for i_patom in indep_atoms:
-        index_shift_i = trans_perms[:, i_patom] * N**2
-        for j in range(N):
-            index_shift_j = index_shift_i + trans_perms[:, j] * N
-            for k in range(N):
-                index_shift = index_shift_j + trans_perms[:, k]
-                indices[index_shift] = n
-                n += 1
+    index_shift = np.empty((len(indep_atoms), N, N), dtype="int_")
+    for perm in trans_perms.astype("int_"):
+        _set_atomic_index_shift(index_shift, perm, indep_atoms)
+        indices[index_shift.reshape(-1)] = values
     assert n * n_lp == size_row
     return indices
 
@@ -88,22 +85,35 @@ def get_lat_trans_decompr_indices_O3(trans_perms: np.ndarray) -> np.ndarray:
     n_lp = N // n_a
     size_row = 27 * N**3
 
-    trans_perms = trans_perms.astype("int_")
-    n = 0
+    n = n_a * N**2 * 27
+    values = np.arange(n, dtype="int_").reshape(-1, 27)
     indices = np.zeros(size_row, dtype="int_")
-    for i_patom in indep_atoms:
-        index_shift_i = trans_perms[:, i_patom] * N**2 * 27
-        for j in range(N):
-            index_shift_j = index_shift_i + trans_perms[:, j] * N * 27
-            for k in range(N):
-                index_shift = index_shift_j + trans_perms[:, k] * 27
-                for ab in range(27):
-                    indices[index_shift + ab] = n
-                    n += 1
+    indices_view = indices.reshape(-1, 27)
+    index_shift = np.empty((n_a, N, N), dtype="int_")
+    for perm in trans_perms.astype("int_"):
+        _set_atomic_index_shift(index_shift, perm, indep_atoms)
+        indices_view[index_shift.reshape(-1)] = values
     assert n * n_lp == size_row
     return indices
 
 
+def _set_atomic_index_shift(
+    index_shift: np.ndarray, perm: np.ndarray, indep_atoms: np.ndarray
+):
+    """Set atomic triplet indices permuted by a lattice translation in-place.
+
+    index_shift[i, j, k] = perm[indep_atoms[i]] * N**2 + perm[j] * N + perm[k]
+
+    """
+    N = len(perm)
+    np.add(
+        perm[indep_atoms][:, None, None] * N**2,
+        perm[None, :, None] * N,
+        out=index_shift,
+    )
+    index_shift += perm[None, None, :]
+
+
 def get_lat_trans_compr_matrix_O3(trans_perms):
     """Return lat trans compression matrix."""
     n_lp, N = trans_perms.shape
@@ -127,10 +137,13 @@ def _get_lat_trans_compr_matrix_O3(
 
     """
     NNN27 = N**3 * 27
+    """Row indices are arange(NNN27), so CSR is constructed without sorting."""
+    dtype = "int32" if NNN27 <= np.iinfo("int32").max else "int64"
     compression_mat = csr_array(
         (
             np.full(NNN27, 1 / np.sqrt(n_lp), dtype="double"),
-            (np.arange(NNN27, dtype=int), decompr_idx),
+            decompr_idx.astype(dtype, copy=False),
+            np.arange(NNN27 + 1, dtype=dtype),
         ),
         shape=(NNN27, NNN27 // n_lp),
         dtype="double",
@@ -168,11 +181,30 @@ def get_compr_coset_projector_O3(
     size_data = np.count_nonzero(nonzero)
     col = atomic_decompr_idx[nonzero]
 
+    """c_pt with at most one nonzero element in each row is applied directly.
+       Rows without nonzero elements appear when fc_cutoff is used."""
+    c_pt_single = None
+    if c_pt is not None:
+        c_pt = c_pt.tocsr()
+        n_elems = np.diff(c_pt.indptr)
+        if np.all(n_elems <= 1):
+            c_pt_indices = np.zeros(c_pt.shape[0], dtype=c_pt.indices.dtype)
+            c_pt_data = np.zeros(c_pt.shape[0], dtype="double")
+            c_pt_indices[n_elems == 1] = c_pt.indices
+            c_pt_data[n_elems == 1] = c_pt.data
+            c_pt_single = (c_pt_indices, c_pt_data)
+
+    """Matrices are added to n_cosets partial sums in turn. Nonzero elements
+       of each partial sum stay compact, which is faster than concatenating
+       all nonzero elements and summing duplicates at once."""
     n_cosets = min([int(np.sqrt(len(spg_reps.unique_rotation_indices))), 4])
     cosets = [csr_array(([], ([], [])), shape=(size, size), dtype="double")] * n_cosets
 
+    permutations = spg_reps.get_all_sigma3_reps(nonzero=nonzero)
+    row = np.empty(size_data, dtype=atomic_decompr_idx.dtype)
+    ones_data = np.ones(size_data, dtype="int_") if c_pt_single is None else None
     factor = 1 / len(spg_reps.unique_rotation_indices)
-    for i, _ in enumerate(spg_reps.unique_rotation_indices):
+    for i, permutation in enumerate(permutations):
         if verbose:
             print(
                 "Coset sum:",
@@ -181,26 +213,62 @@ def get_compr_coset_projector_O3(
                 len(spg_reps.unique_rotation_indices),
                 flush=True,
             )
-        permutation = spg_reps.get_sigma3_rep(i, nonzero=nonzero)
+        np.take(atomic_decompr_idx, permutation, out=row)
         """Equivalent to mat = C.T @ spg_reps.get_sigma3_rep(i) @ C
            C: atomic_lat_trans_compr_mat, shape=(NNN, NNN/n_lp)"""
-        mat = csr_array(
-            (
-                np.ones(size_data, dtype="int_"),
-                (atomic_decompr_idx[permutation], col),
-            ),
-            shape=(N**3 // n_lp, N**3 // n_lp),
-            dtype="int_",
-        )
-        mat = kron(mat, spg_reps.r_reps[i] * factor).tocsr()
-        if c_pt is not None:
-            mat = dot_product_sparse(c_pt.T, mat, use_mkl=use_mkl)
-            mat = dot_product_sparse(mat, c_pt, use_mkl=use_mkl)
+        if c_pt_single is not None:
+            mat = _get_compr_coset_rep_O3(
+                row, col, spg_reps.r_reps[i] * factor, *c_pt_single, size
+            )
+        else:
+            mat = csr_array(
+                (ones_data, (row, col)),
+                shape=(N**3 // n_lp, N**3 // n_lp),
+                dtype="int_",
+            )
+            mat = kron(mat, spg_reps.r_reps[i] * factor).tocsr()
+            if c_pt is not None:
+                mat = dot_product_sparse(c_pt.T, mat, use_mkl=use_mkl)
+                mat = dot_product_sparse(mat, c_pt, use_mkl=use_mkl)
 
         cosets[i % n_cosets] += mat
     return sum(cosets)
 
 
+def _get_compr_coset_rep_O3(
+    row: np.ndarray,
+    col: np.ndarray,
+    r_rep: csr_array,
+    c_pt_indices: np.ndarray,
+    c_pt_data: np.ndarray,
+    size: int,
+) -> csr_array:
+    """Return c_pt.T @ kron(mat, r_rep) @ c_pt without allocating kron.
+
+    mat is the atomic permutation matrix whose nonzero elements are one at
+    (row, col). This is only valid when c_pt has at most one nonzero element
+    in each row, i.e., c_pt[m] = c_pt_data[m] * e(c_pt_indices[m]), where
+    c_pt_data[m] = 0 for empty rows. Then nonzero elements of kron(mat, r_rep)
+    are mapped directly to those of the product.
+
+    """
+    r_rep = r_rep.tocoo()
+    row_kron = (row[:, None] * 27 + r_rep.row[None, :]).reshape(-1)
+    col_kron = (col[:, None] * 27 + r_rep.col[None, :]).reshape(-1)
+    data = np.tile(r_rep.data, len(row))
+    data *= c_pt_data[row_kron]
+    data *= c_pt_data[col_kron]
+    nonzero = data != 0
+    return csr_array(
+        (
+            data[nonzero],
+            (c_pt_indices[row_kron[nonzero]], c_pt_indices[col_kron[nonzero]]),
+        ),
+        shape=(size, size),
+        dtype="double",
+    )
+
+
 def get_compr_coset_projector_O3_stable(
     spg_reps: SpgRepsO3,
     atomic_decompr_idx: Optional[np.ndarray] = None,
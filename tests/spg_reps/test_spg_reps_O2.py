@@ -15,3 +15,12 @@ def test_spg_reps_o2(cell_nacl_111: SymfcAtoms):
             spg_reps_o2.get_sigma2_rep(i) == np.arange(64, dtype=int)
         )
     assert trace_sum == 960
+
+
+def test_spg_reps_o2_r_reps(cell_nacl_111: SymfcAtoms):
+    """Test of SpgRepsO2.r_reps compared with dense kron."""
+    spg_reps_o2 = SpgRepsO2(cell_nacl_111)
+    lattice = cell_nacl_111.cell.T
+    for r, r2_rep in zip(spg_reps_o2._unique_rotations, spg_reps_o2.r_reps):
+        r_c = lattice @ r @ np.linalg.inv(lattice)
+        np.testing.assert_allclose(r2_rep.toarray(), np.kron(r_c, r_c), atol=1e-10)
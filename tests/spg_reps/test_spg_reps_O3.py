@@ -15,3 +15,16 @@ def test_spg_reps_o3(cell_nacl_111: SymfcAtoms):
             spg_reps_o3.get_sigma3_rep(i) == np.arange(512, dtype=int)
         )
     assert trace_sum == 5760
+
+
+def test_spg_reps_o3_all_sigma3_reps(cell_nacl_111: SymfcAtoms):
+    """Test of SpgRepsO3.get_all_sigma3_reps."""
+    spg_reps_o3 = SpgRepsO3(cell_nacl_111)
+    nonzero = np.arange(512) % 3 == 0
+    for mask in (None, nonzero):
+        sigma3_reps = spg_reps_o3.get_all_sigma3_reps(nonzero=mask)
+        assert sigma3_reps.shape[0] == len(spg_reps_o3.unique_rotation_indices)
+        for i, sigma3_rep in enumerate(sigma3_reps):
+            np.testing.assert_array_equal(
+                sigma3_rep, spg_reps_o3.get_sigma3_rep(i, nonzero=mask)
+            )
@@ -5,6 +5,7 @@ import pytest
 
 from symfc.spg_reps import SpgRepsO3
 from symfc.utils.cutoff_tools import FCCutoff
+from symfc.utils.permutation_tools_O3 import compr_permutation_lat_trans_O3
 from symfc.utils.utils import SymfcAtoms
 from symfc.utils.utils_O3 import (
     get_atomic_lat_trans_decompr_indices_O3,
@@ -78,3 +79,39 @@ def test_coset_projector_O3():
     )
     assert coset.trace() == pytest.approx(4.0)
     assert np.sum(coset.data) == pytest.approx(0.0)
+
+
+def test_coset_projector_O3_c_pt():
+    """Test get_compr_coset_projector_O3 with c_pt."""
+    supercell_rev, trans_perms_rev, spg_reps_rev = structure_bcc_rev()
+    atomic_decompr_idx = get_atomic_lat_trans_decompr_indices_O3(trans_perms_rev)
+    coset = get_compr_coset_projector_O3(spg_reps_rev, atomic_decompr_idx)
+    c_pt = compr_permutation_lat_trans_O3(
+        trans_perms_rev, atomic_decompr_idx=atomic_decompr_idx
+    )
+    coset_c_pt = get_compr_coset_projector_O3(
+        spg_reps_rev, atomic_decompr_idx, c_pt=c_pt
+    )
+    np.testing.assert_allclose(
+        coset_c_pt.toarray(), (c_pt.T @ coset @ c_pt).toarray(), atol=1e-12
+    )
+
+
+def test_coset_projector_O3_c_pt_cutoff():
+    """Test get_compr_coset_projector_O3 with c_pt and fc_cutoff."""
+    supercell_rev, trans_perms_rev, spg_reps_rev = structure_bcc_rev()
+    atomic_decompr_idx = get_atomic_lat_trans_decompr_indices_O3(trans_perms_rev)
+    fc_cutoff = FCCutoff(supercell_rev, cutoff=1)
+    coset = get_compr_coset_projector_O3(
+        spg_reps_rev, atomic_decompr_idx, fc_cutoff=fc_cutoff
+    )
+    c_pt = compr_permutation_lat_trans_O3(
+        trans_perms_rev, atomic_decompr_idx=atomic_decompr_idx, fc_cutoff=fc_cutoff
+    )
+    assert np.any(np.diff(c_pt.indptr) == 0)
+    coset_c_pt = get_compr_coset_projector_O3(
+        spg_reps_rev, atomic_decompr_idx, fc_cutoff=fc_cutoff, c_pt=c_pt
+    )
+    np.testing.assert_allclose(
+        coset_c_pt.toarray(), (c_pt.T @ coset @ c_pt).toarray(), atol=1e-12
+    )